@@ -4,11 +4,121 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import stat
-import subprocess
-import glob
+import shutil
+import string
 from pathlib import Path
 import shlex # For robust parsing of Exec strings
 import re # For regex to extract Flatpak ID
+import json
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+# Finds the app ID after 'flatpak run' and any --flags, before placeholders
+_FLATPAK_RE = re.compile(r"flatpak run\s+(?:--\S+\s+)*([a-zA-Z0-9._-]+)(?=\s|\Z)")
+
+# Filename sanitizing: ASCII characters outside this set become '_' (all non-ASCII characters,
+# including symbols and emoji, are kept as-is), then runs of underscores are collapsed
+_SAFE_KEEP = set(string.ascii_letters + string.digits + ' -_.')
+_XLATE = {cp: ord('_') for cp in range(128) if chr(cp) not in _SAFE_KEEP}
+_UNDERSCORES_RE = re.compile(r'_+')
+
+# On-disk app cache format; bump whenever the shape of the cached app dicts changes
+_APP_CACHE_VERSION = 1
+_APP_CACHE_KEYS = frozenset({'name', 'exec', 'resolved_path', 'resolved_bin', 'is_flatpak',
+                             'icon', 'comment', 'categories', 'terminal', 'desktop_file'})
+
+# .desktop Categories tokens (lowercased) -> category offered in the dropdown, in priority order
+_CATEGORY_MAP = (
+    (frozenset({'game'}), 'Game'),
+    (frozenset({'development', 'programming', 'ide'}), 'Development'),
+    (frozenset({'office', 'wordprocessor', 'spreadsheet', 'presentation'}), 'Office'),
+    (frozenset({'graphics', 'image', 'photography', 'design'}), 'Graphics'),
+    (frozenset({'audiovideo', 'audio', 'video', 'sound'}), 'AudioVideo'),
+    (frozenset({'network', 'internet', 'webbrowser'}), 'Network'),
+    (frozenset({'system', 'utility', 'settings'}), 'System'),
+    (frozenset({'education'}), 'Education'),
+    (frozenset({'science'}), 'Science'),
+    (frozenset({'finance'}), 'Finance'),
+)
+
+def _read_small(path, size=16384):
+    """Read a small UTF-8 text file with raw os.read calls, skipping the text I/O stack.
+
+    Nearly all .desktop files fit in one read; a full-sized read means there may be more,
+    so we keep reading rather than truncate large entries.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = [os.read(fd, size)]
+        while len(chunks[-1]) == size:
+            chunks.append(os.read(fd, size))
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode('utf-8', 'replace')
+
+def _parse_desktop_entry(lines, k_name, k_icon, k_comment):
+    """Extract the fields we use from the [Desktop Entry] section of a .desktop file.
+
+    k_name/k_icon/k_comment are the locale-qualified keys (e.g. 'Name[de_DE]'). Only the keys
+    we need are kept, in locals; everything else is skipped. Stops at the next section.
+    Returns (name, exec, icon, comment, categories, terminal, is_flatpak), or None if the
+    file has no [Desktop Entry] section.
+    """
+    seen_entry = in_entry = False
+    name = name_l = generic = exec_string = icon = icon_l = comment = comment_l = None
+    categories = terminal = x_flatpak = ''
+    for raw in lines:
+        line = raw.strip()
+        if line.startswith('[') and line.endswith(']'):
+            if in_entry:
+                break # Trailing [Desktop Action ...] sections are never used
+            in_entry = line == '[Desktop Entry]'
+            seen_entry = seen_entry or in_entry
+            continue
+        if not in_entry:
+            continue
+        key, sep, value = line.partition('=')
+        if not sep:
+            continue
+        if key == k_name:
+            name_l = value
+        elif key == 'Name':
+            name = value
+        elif key == 'GenericName':
+            generic = value
+        elif key == 'Exec':
+            exec_string = value
+        elif key == k_icon:
+            icon_l = value
+        elif key == 'Icon':
+            icon = value
+        elif key == k_comment:
+            comment_l = value
+        elif key == 'Comment':
+            comment = value
+        elif key == 'Categories':
+            categories = value
+        elif key == 'Terminal':
+            terminal = value
+        elif key == 'X-Flatpak':
+            x_flatpak = value
+    
+    if not seen_entry:
+        return None
+    # Localized values win over the plain ones; fall back to GenericName if there's no name at all
+    name = name_l if name_l is not None else (name or '')
+    if not name:
+        name = generic or ''
+    return (
+        name,
+        exec_string or '',
+        icon_l if icon_l is not None else (icon or ''),
+        comment_l if comment_l is not None else (comment or ''),
+        categories,
+        terminal.lower() == 'true',
+        x_flatpak.lower() == 'true',
+    )
 
 class ShortcutCreator:
     def __init__(self, root):
@@ -38,19 +148,61 @@ class ShortcutCreator:
         
         # 1. Initialize applications list (empty for now)
         self.applications = [] 
+        self._apps_by_name = {} # name -> app dict, rebuilt in update_app_dropdown()
+
+        # Parsed application list is cached here, keyed by the mtimes of the scanned directories
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        self.cache_file = Path(cache_home) / "shortcut-creator" / "apps.json"
+
+        # Home directory and Flatpak export prefixes, built once instead of per parsed file
+        self._home = str(Path.home())
+        self._flatpak_prefixes = (
+            '/var/lib/flatpak/exports/share/applications/',
+            f'{self._home}/.local/share/flatpak/exports/share/applications/',
+        )
+
+        # Locale-qualified .desktop keys, computed once instead of per parsed file
+        self._lang = os.environ.get('LANG', 'en_US.UTF-8').split('.')[0]
+        self._k_name, self._k_icon, self._k_comment = (f'Name[{self._lang}]', f'Icon[{self._lang}]', f'Comment[{self._lang}]')
+
+        # PATH lookups are memoized per basename so repeated Exec commands only hit the filesystem once
+        self._path_env = os.environ.get("PATH", "")
+        self._which_cache = {}
+        self._access_cache = {}
+
+        # Log messages are buffered here while inside _batched_logs()
+        self._log_buf = []
+        self._log_depth = 0
 
         # 2. Create widgets. This sets up self.status_text and other GUI elements.
         self.create_widgets()
         
-        # 3. Load applications. Now self.applications is a list, and self.status_text exists for logging.
-        self.load_applications() 
-        
         # Initial log messages after everything is set up
         self.log_message(f"Desktop directory: {self.desktop_path}\n")
-        self.log_message(f"Found {len(self.applications)} installed applications.\n")
-
-        # After applications are loaded, update the dropdown
+        
+        # 3. Load applications on a background thread so the window paints immediately.
+        #    The dropdown is populated once the scan finishes (see _on_applications_loaded).
+        self.app_combo.set("Loading…")
+        self.refresh_btn.state(['disabled']) # Re-enabled once the background scan has finished
+        threading.Thread(target=self._bg_load, daemon=True).start()
+        
+    def _bg_load(self):
+        """Scan applications off the Tk thread, then hand the results back to it"""
+        try:
+            warnings = self.load_applications()
+        except Exception as e:
+            warnings = [f"WARNING: Error loading applications: {e}\n"]
+        # Tk is not thread-safe: marshal all GUI work back onto the main loop
+        self.root.after(0, self._on_applications_loaded, warnings)
+    
+    def _on_applications_loaded(self, warnings):
+        """Log scan results and populate the dropdown (runs on the Tk thread)"""
+        with self._batched_logs():
+            for warning in warnings:
+                self.log_message(warning)
+            self.log_message(f"Found {len(self.applications)} installed applications.\n")
         self.update_app_dropdown()
+        self.refresh_btn.state(['!disabled'])
         
     def create_widgets(self):
         # Main frame
@@ -80,8 +232,8 @@ class ShortcutCreator:
         self.app_combo.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
         self.app_combo.bind('<<ComboboxSelected>>', self.on_app_selected)
         
-        refresh_btn = ttk.Button(main_frame, text="Refresh", command=self.refresh_applications)
-        refresh_btn.grid(row=2, column=2, padx=(5, 0), pady=5)
+        self.refresh_btn = ttk.Button(main_frame, text="Refresh", command=self.refresh_applications)
+        self.refresh_btn.grid(row=2, column=2, padx=(5, 0), pady=5)
         
         # Application Path (now shows resolved path, editable)
         ttk.Label(main_frame, text="Application Path:").grid(row=3, column=0, sticky=tk.W, pady=5)
@@ -153,116 +305,152 @@ class ShortcutCreator:
         
         self.log_message("Desktop Shortcut Creator initialized.\n") # Initial message
 
-    def load_applications(self):
-        """Load all installed applications from .desktop files"""
-        self.applications = []
+    def load_applications(self, use_cache=True):
+        """Load all installed applications from .desktop files.
+
+        Safe to call off the Tk thread: nothing is logged here, parse warnings are returned instead.
+        If use_cache is set and none of the scanned directories changed, the on-disk cache is used.
+        """
+        applications = []
+        warnings = []
+        # Start each pass with fresh lookup caches so a refresh picks up newly installed binaries
+        self._which_cache = {}
+        self._access_cache = {}
+        # Existing application directories and their mtimes; this doubles as the cache key
+        signature = dict(self._iter_desktop_dirs())
+        
+        # Warm start: reuse the cached list if no application directory changed since it was written
+        if use_cache:
+            cached = self._read_app_cache(signature)
+            if cached is not None:
+                self.applications = cached
+                return warnings
+        
+        # Parse in parallel to overlap file I/O, keeping the valid entries and collecting
+        # buffered warnings for the caller
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for app_info in executor.map(self.parse_desktop_file, self._iter_app_files(signature)):
+                if app_info is None:
+                    continue
+                if 'warning' in app_info:
+                    warnings.append(app_info['warning'])
+                    continue
+                # Only add if we got a valid name and an executable command
+                if app_info['name'] and app_info['exec']:
+                    applications.append(app_info)
+        
+        # Sort applications by name, then publish the finished list in one assignment
+        applications.sort(key=lambda x: x['name'].lower())
+        self.applications = applications
+        
+        try:
+            self._write_app_cache(signature, applications)
+        except OSError as e:
+            warnings.append(f"WARNING: Could not write application cache {self.cache_file}: {e}\n")
+        return warnings
+    
+    def _iter_desktop_dirs(self):
+        """Yield (directory, st_mtime_ns) for each existing application directory.
+
+        Directories are deduped by real path (trailing slashes and symlinked aliases collapse) in
+        order. The first spelling is kept so the Flatpak prefix checks in parse_desktop_file still match.
+        """
         # Standard XDG application directories
         desktop_dirs = [
             "/usr/share/applications/",
             "/usr/local/share/applications/",
-            f"{Path.home()}/.local/share/applications/",
+            f"{self._home}/.local/share/applications/",
             # Snap applications (these typically have their own .desktop structure that points to a launcher)
             "/var/lib/snapd/desktop/applications/",
             # Flatpak applications export their .desktop files here, often containing X-Flatpak=true
             "/var/lib/flatpak/exports/share/applications/",
-            f"{Path.home()}/.local/share/flatpak/exports/share/applications/"
+            f"{self._home}/.local/share/flatpak/exports/share/applications/"
         ]
-        
         # Add XDG_DATA_DIRS if set, typically includes more system-wide paths
-        xdg_data_dirs = os.environ.get("XDG_DATA_DIRS", "").split(":")
-        for d in xdg_data_dirs:
-            if d and d not in desktop_dirs: # Avoid duplicates
+        for d in os.environ.get("XDG_DATA_DIRS", "").split(":"):
+            if d:
                 desktop_dirs.append(os.path.join(d, "applications"))
-
         # Add XDG_DATA_HOME if set, typically ~/.local/share/
-        xdg_data_home = os.environ.get("XDG_DATA_HOME", f"{Path.home()}/.local/share")
-        if xdg_data_home and f"{Path.home()}/.local/share/applications/" not in desktop_dirs: # Avoid duplicates
-             desktop_dirs.append(os.path.join(xdg_data_home, "applications"))
-             
-        # Dedup and ensure paths exist
-        desktop_dirs = [d for d in list(set(desktop_dirs)) if os.path.exists(d)]
-        
+        xdg_data_home = os.environ.get("XDG_DATA_HOME", f"{self._home}/.local/share")
+        if xdg_data_home:
+            desktop_dirs.append(os.path.join(xdg_data_home, "applications"))
+        
+        seen = set()
+        for d in desktop_dirs:
+            key = os.path.realpath(d).rstrip('/')
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            # One stat serves both the existence check and the cache signature
+            try:
+                st = os.stat(key)
+            except OSError:
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                yield d.rstrip('/'), st.st_mtime_ns
+    
+    def _iter_app_files(self, desktop_dirs):
+        """Yield the path of every .desktop file in the given directories"""
         for directory in desktop_dirs:
-            for file_path in glob.glob(f"{directory}*.desktop"):
-                app_info = self.parse_desktop_file(file_path)
-                # Only add if we got a valid name and an executable command
-                if app_info and app_info['name'] and app_info['exec']:
-                    self.applications.append(app_info)
-        
-        # Sort applications by name
-        self.applications.sort(key=lambda x: x['name'].lower())
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue # Removed since it was listed, or not readable by us
+            with entries:
+                for entry in entries:
+                    # is_file() follows symlinks on purpose: Flatpak exports are symlinks into the app install
+                    if entry.name.endswith('.desktop') and entry.is_file():
+                        yield entry.path
     
-    def parse_desktop_file(self, file_path):
-        """Parse a .desktop file and extract relevant information"""
+    def _read_app_cache(self, signature):
+        """Return the cached application list if it was built from the same directory signature"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            desktop_dict = {}
-            current_section = None
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1]
-                elif current_section == "Desktop Entry" and '=' in line:
-                    key, value = line.split('=', 1)
-                    desktop_dict[key] = value
-
-            # Extract preferred values
-            lang_code = os.environ.get('LANG', 'en_US.UTF-8').split('.')[0]
-            name = desktop_dict.get(f'Name[{lang_code}]', desktop_dict.get('Name', ''))
-            if not name:
-                name = desktop_dict.get('GenericName', '')
-
-            exec_string_original = desktop_dict.get('Exec', '') # Store the original Exec value
-            icon = desktop_dict.get(f'Icon[{lang_code}]', desktop_dict.get('Icon', ''))
-            comment = desktop_dict.get(f'Comment[{lang_code}]', desktop_dict.get('Comment', ''))
-            categories = desktop_dict.get('Categories', '')
-            terminal = desktop_dict.get('Terminal', '').lower() == 'true'
-            
-            # --- IMPROVED FLATPAK/SNAP HANDLING IN PARSING ---
-            resolved_exec_command = exec_string_original # Default to original
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Names/icons/comments are localized, so a LANG change also invalidates the cache
+        if not isinstance(cache, dict) or cache.get('version') != _APP_CACHE_VERSION or \
+           cache.get('sig') != signature or cache.get('lang') != self._lang:
+            return None
+        # Anything that doesn't look like our app dicts (old, newer or damaged cache) means rescan
+        apps = cache.get('apps')
+        if not isinstance(apps, list) or \
+           not all(isinstance(app, dict) and _APP_CACHE_KEYS <= app.keys() for app in apps):
+            return None
+        return apps
+    
+    def _write_app_cache(self, signature, applications):
+        """Persist the parsed application list together with the directory signature"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_file.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': _APP_CACHE_VERSION, 'sig': signature, 'lang': self._lang, 'apps': applications}, f)
+        os.replace(tmp_path, self.cache_file) # Atomic, so a crash never leaves a half-written cache
+    
+    def parse_desktop_file(self, file_path):
+        """Parse a .desktop file and extract relevant information.
 
-            is_flatpak = desktop_dict.get('X-Flatpak', '').lower() == 'true' or \
-                         file_path.startswith('/var/lib/flatpak/exports/share/applications/') or \
-                         file_path.startswith(f"{Path.home()}/.local/share/flatpak/exports/share/applications/")
+        Runs on worker threads, so it must not touch Tk; errors are returned as {'warning': ...}.
+        Returns None for files without a [Desktop Entry] section.
+        """
+        try:
+            content = _read_small(file_path)
+            parsed = _parse_desktop_entry(content.split('\n'), self._k_name, self._k_icon, self._k_comment)
+            if parsed is None:
+                return None # No [Desktop Entry] section, nothing to offer
+            name, exec_string_original, icon, comment, categories, terminal, is_flatpak = parsed
             
-            is_snap = 'snap/gui' in exec_string_original and not is_flatpak # Snap detection
-
-            if is_flatpak:
-                # Flatpak's Exec line often looks like:
-                # Exec=/usr/bin/flatpak run --branch=stable --arch=x86_64 --command=zen-browser app.zen_browser.zen @@u %U @@
-                # We need to extract the 'app.zen_browser.zen' ID and form 'flatpak run <ID>'
-                # Or sometimes just: Exec=flatpak run org.gnome.Lollypop
-                
-                # Regex to find the app ID after 'flatpak run' and before flags/placeholders
-                match = re.search(r"flatpak run\s+(--[a-zA-Z0-9=\-\.]+?\s+)*?([a-zA-Z0-9\.\-_]+)(?=\s|\Z)", exec_string_original)
-                if match:
-                    flatpak_id = match.group(2)
-                    resolved_exec_command = f"flatpak run {flatpak_id}"
-                    # Often the icon is also just the Flatpak ID
-                    if not icon or icon == exec_string_original.split('/')[-1].split(' ')[0]: # If icon is generic or derived from exec
-                        icon = flatpak_id
-                    self.log_message(f"DEBUG: Identified Flatpak '{name}' (ID: {flatpak_id}), simplified Exec to: '{resolved_exec_command}'\n")
-                else:
-                    self.log_message(f"WARNING: Could not parse Flatpak ID from Exec '{exec_string_original}' for '{name}'. Using original.\n")
-                    resolved_exec_command = exec_string_original # Fallback
-            elif is_snap:
-                # Snap apps also use a wrapper. Their Exec looks like /snap/bin/appname or /usr/bin/env snap run appname
-                # We generally want to preserve the original Exec for snap, or simplify to 'snap run <snap_name>'
-                # For this script, we'll try to use the raw Exec value if it's already a snap command.
-                # If it's a direct path to a snap wrapper, e.g. /snap/vlc/current/desktop-launch, just use that.
-                self.log_message(f"DEBUG: Identified Snap app '{name}', using original Exec: '{exec_string_original}'\n")
-                resolved_exec_command = exec_string_original
-            else:
-                # For regular apps, try to resolve the executable path
-                resolved_exec_command = self.find_executable_path(exec_string_original)
-            # --- END IMPROVED FLATPAK/SNAP HANDLING ---
+            # Flatpak detection is cheap, so do it here; the actual Exec resolution is deferred
+            # to _ensure_resolved() until the user selects this app.
+            is_flatpak = is_flatpak or file_path.startswith(self._flatpak_prefixes)
             
             return {
                 'name': name,
                 'exec': exec_string_original, # Keep original exec string as read from file
-                'resolved_path': resolved_exec_command, # This is what will be shown/used in GUI and for shortcut's Exec
+                'resolved_path': None, # Filled in lazily by _ensure_resolved(); shown/used in GUI and for shortcut's Exec
+                'resolved_bin': None, # Absolute binary path, set alongside resolved_path when known
+                'is_flatpak': is_flatpak,
                 'icon': icon,
                 'comment': comment,
                 'categories': categories,
@@ -270,11 +458,69 @@ class ShortcutCreator:
                 'desktop_file': file_path
             }
         except Exception as e:
-            self.log_message(f"WARNING: Error parsing desktop file {file_path}: {e}\n")
-            return None
+            return {'warning': f"WARNING: Error parsing desktop file {file_path}: {e}\n"}
+    
+    def _ensure_resolved(self, app):
+        """Resolve the app's Exec command on first use and memoize it on the app dict"""
+        if app['resolved_path'] is not None:
+            return app['resolved_path']
+        
+        exec_string = app['exec']
+        # --- IMPROVED FLATPAK/SNAP HANDLING ---
+        resolved_exec_command = exec_string # Default to original
+        resolved_bin = None # Absolute binary behind the Exec, used by create_shortcut for Path=
+
+        if app['is_flatpak']:
+            # Flatpak's Exec line often looks like:
+            # Exec=/usr/bin/flatpak run --branch=stable --arch=x86_64 --command=zen-browser app.zen_browser.zen @@u %U @@
+            # We need to extract the 'app.zen_browser.zen' ID and form 'flatpak run <ID>'
+            # Or sometimes just: Exec=flatpak run org.gnome.Lollypop
+
+            match = _FLATPAK_RE.search(exec_string)
+            if match:
+                flatpak_id = match.group(1)
+                resolved_exec_command = f"flatpak run {flatpak_id}"
+                # Often the icon is also just the Flatpak ID
+                if not app['icon'] or app['icon'] == exec_string.split('/')[-1].split(' ')[0]: # If icon is generic or derived from exec
+                    app['icon'] = flatpak_id
+                self.log_message(f"DEBUG: Identified Flatpak '{app['name']}' (ID: {flatpak_id}), simplified Exec to: '{resolved_exec_command}'\n")
+            else:
+                self.log_message(f"WARNING: Could not parse Flatpak ID from Exec '{exec_string}' for '{app['name']}'. Using original.\n")
+                resolved_exec_command = exec_string # Fallback
+                resolved_bin = self._resolve_absolute(exec_string)
+        elif 'snap/gui' in exec_string: # Snap detection
+            # Snap apps also use a wrapper. Their Exec looks like /snap/bin/appname or /usr/bin/env snap run appname
+            # We generally want to preserve the original Exec for snap, or simplify to 'snap run <snap_name>'
+            # For this script, we'll try to use the raw Exec value if it's already a snap command.
+            # If it's a direct path to a snap wrapper, e.g. /snap/vlc/current/desktop-launch, just use that.
+            self.log_message(f"DEBUG: Identified Snap app '{app['name']}', using original Exec: '{exec_string}'\n")
+            resolved_exec_command = exec_string
+            resolved_bin = self._resolve_absolute(exec_string)
+        else:
+            # For regular apps, try to resolve the executable path
+            resolved_bin = self._resolve_absolute(exec_string)
+            resolved_exec_command = resolved_bin or exec_string
+        # --- END IMPROVED FLATPAK/SNAP HANDLING ---
+        
+        app['resolved_bin'] = resolved_bin
+        app['resolved_path'] = resolved_exec_command
+        return resolved_exec_command
+    
+    def _resolve_absolute(self, exec_string):
+        """Return the absolute path of the binary an Exec string runs, or None if it can't be resolved"""
+        resolved = self.find_executable_path(exec_string)
+        if os.path.isabs(resolved) and os.path.isfile(resolved):
+            return resolved
+        return None
     
     def find_executable_path(self, exec_string):
         """Find the actual executable path from the Exec string for non-Flatpak/Snap apps."""
+        # Fast path: most Exec lines start with a plain absolute path, which needs no shlex/PATH work
+        sp = exec_string.find(' ')
+        head = exec_string[:sp] if sp > 0 else exec_string
+        if head.startswith('/') and '%' not in head and self._is_executable(head):
+            return head
+        
         try:
             exec_parts = shlex.split(exec_string)
         except ValueError:
@@ -292,43 +538,47 @@ class ShortcutCreator:
 
         # Case 1: Absolute path
         if os.path.isabs(exec_candidate):
-            if os.path.exists(exec_candidate) and os.access(exec_candidate, os.X_OK):
+            if self._is_executable(exec_candidate):
                 return exec_candidate
             else:
                 self.log_message(f"DEBUG: Absolute path '{exec_candidate}' not found or not executable.\n")
         
-        # Case 2: Command in PATH
-        try:
-            result = subprocess.run(['which', exec_candidate], 
-                                    capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                resolved_path = result.stdout.strip()
-                if os.access(resolved_path, os.X_OK):
-                    return resolved_path
-                else:
-                    self.log_message(f"DEBUG: Found '{resolved_path}' via which, but it's not executable.\n")
+        # Case 2: Command in PATH (resolved in-process, cached by basename)
+        if exec_candidate not in self._which_cache:
+            self._which_cache[exec_candidate] = shutil.which(exec_candidate, path=self._path_env)
+        resolved_path = self._which_cache[exec_candidate]
+        if resolved_path:
+            if self._is_executable(resolved_path):
+                return resolved_path
             else:
-                self.log_message(f"DEBUG: 'which {exec_candidate}' failed: {result.stderr.strip()}\n")
-        except FileNotFoundError:
-            self.log_message("WARNING: 'which' command not found. Cannot resolve executables in PATH.\n")
-        except Exception as e:
-            self.log_message(f"WARNING: Error running 'which' for '{exec_candidate}': {e}\n")
+                self.log_message(f"DEBUG: Found '{resolved_path}' in PATH, but it's not executable.\n")
+        else:
+            self.log_message(f"DEBUG: '{exec_candidate}' not found in PATH.\n")
         
         return exec_string  # Return original Exec string as fallback if we can't resolve or not executable
     
+    def _is_executable(self, path):
+        """Return whether path exists and is executable, caching the result"""
+        if path not in self._access_cache:
+            self._access_cache[path] = os.path.exists(path) and os.access(path, os.X_OK)
+        return self._access_cache[path]
+    
     def refresh_applications(self):
         """Refresh the applications list"""
         self.log_message("Refreshing applications list...\n")
-        self.load_applications()
-        self.update_app_dropdown()
-        self.log_message(f"Found {len(self.applications)} applications.\n")
+        with self._batched_logs():
+            for warning in self.load_applications(use_cache=False):
+                self.log_message(warning)
+            self.update_app_dropdown()
+            self.log_message(f"Found {len(self.applications)} applications.\n")
     
     def update_app_dropdown(self):
         """Update the application dropdown with current applications"""
-        app_names = [f"{app['name']}" for app in self.applications if app['name']] # Ensure name exists
+        app_names = [app['name'] for app in self.applications if app['name']] # Ensure name exists
         self.app_combo['values'] = app_names
-        if app_names:
-            self.app_combo.set("")  # Clear selection
+        self.app_combo.set("")  # Clear selection (and the "Loading…" placeholder)
+        # Built in reverse so the first app wins on duplicate names, as the old linear search did
+        self._apps_by_name = {a['name']: a for a in reversed(self.applications) if a['name']}
     
     def on_app_selected(self, event=None):
         """Handle application selection from dropdown"""
@@ -337,7 +587,7 @@ class ShortcutCreator:
             return
         
         # Find the selected application by name
-        selected_app = next((app for app in self.applications if app['name'] == selected_name), None)
+        selected_app = self._apps_by_name.get(selected_name)
         
         if selected_app:
             # Auto-fill fields, but only if they are currently empty or if the user explicitly clears them later
@@ -345,6 +595,7 @@ class ShortcutCreator:
                 self.name_var.set(selected_app['name'])
             
             # Use resolved_path for display, which now can be 'flatpak run <ID>' or actual binary path
+            self._ensure_resolved(selected_app)
             self.path_var.set(selected_app['resolved_path'])
             
             if selected_app['icon']:
@@ -357,33 +608,10 @@ class ShortcutCreator:
             else:
                 self.desc_var.set("") # Clear if no comment for this app
             
-            # Set category based on the app's categories (more comprehensive matching)
-            if selected_app['categories']:
-                categories_lower = selected_app['categories'].lower()
-                if 'game' in categories_lower:
-                    self.categories_var.set('Game')
-                elif 'development' in categories_lower or 'programming' in categories_lower or 'ide' in categories_lower:
-                    self.categories_var.set('Development')
-                elif 'office' in categories_lower or 'wordprocessor' in categories_lower or 'spreadsheet' in categories_lower or 'presentation' in categories_lower:
-                    self.categories_var.set('Office')
-                elif 'graphics' in categories_lower or 'image' in categories_lower or 'photography' in categories_lower or 'design' in categories_lower:
-                    self.categories_var.set('Graphics')
-                elif 'audiovideo' in categories_lower or 'audio' in categories_lower or 'video' in categories_lower or 'sound' in categories_lower:
-                    self.categories_var.set('AudioVideo')
-                elif 'network' in categories_lower or 'internet' in categories_lower or 'webbrowser' in categories_lower:
-                    self.categories_var.set('Network')
-                elif 'system' in categories_lower or 'utility' in categories_lower or 'settings' in categories_lower:
-                    self.categories_var.set('System')
-                elif 'education' in categories_lower:
-                    self.categories_var.set('Education')
-                elif 'science' in categories_lower:
-                    self.categories_var.set('Science')
-                elif 'finance' in categories_lower:
-                    self.categories_var.set('Finance')
-                else:
-                    self.categories_var.set('Application') # Default if no specific match
-            else:
-                self.categories_var.set('Application') # Default if no categories found
+            # Set category based on the app's categories: first table entry sharing a token wins
+            tokens = set(selected_app['categories'].lower().replace(';', ' ').split())
+            category = next((label for keys, label in _CATEGORY_MAP if not tokens.isdisjoint(keys)), 'Application')
+            self.categories_var.set(category) # 'Application' if no specific match or no categories found
             
             self.terminal_var.set(selected_app['terminal'])
             
@@ -443,8 +671,28 @@ class ShortcutCreator:
         self.log_message("Fields cleared.\n")
         
     def log_message(self, message):
-        """Add a message to the status text area"""
-        self.status_text.insert(tk.END, message)
+        """Add a message to the status text area (buffered while inside _batched_logs())"""
+        self._log_buf.append(message)
+        if self._log_depth == 0:
+            self._flush_logs()
+    
+    @contextmanager
+    def _batched_logs(self):
+        """Collect log messages and write them with a single insert/redraw on exit"""
+        self._log_depth += 1
+        try:
+            yield
+        finally:
+            self._log_depth -= 1
+            if self._log_depth == 0:
+                self._flush_logs()
+    
+    def _flush_logs(self):
+        """Write any buffered log messages to the status text area"""
+        if not self._log_buf:
+            return
+        self.status_text.insert(tk.END, "".join(self._log_buf))
+        self._log_buf = []
         self.status_text.see(tk.END) # Scroll to end
         self.root.update_idletasks() # Force update
         
@@ -484,34 +732,43 @@ class ShortcutCreator:
                     working_dir = str(Path(exec_command).parent)
             else:
                 # If it's not an absolute path, assume it's a command in PATH and try to find its parent.
-                resolved_bin_path = self.find_executable_path(exec_command)
-                if Path(resolved_bin_path).is_absolute() and Path(resolved_bin_path).is_file():
+                # Reuse the binary resolved on selection unless the user has edited the path field.
+                selected_app = self._apps_by_name.get(self.app_var.get())
+                if selected_app and selected_app['resolved_path'] == exec_command:
+                    resolved_bin_path = selected_app['resolved_bin']
+                else:
+                    resolved_bin_path = self._resolve_absolute(exec_command)
+                if resolved_bin_path:
                     working_dir = str(Path(resolved_bin_path).parent)
                 else:
                     self.log_message(f"WARNING: Could not determine working directory for '{exec_command}'. Path= field will be empty.\n")
         # --- END UPDATED PATH= LOGIC ---
         
         # Prepare desktop file content
-        desktop_content = "[Desktop Entry]\n"
-        desktop_content += "Version=1.0\n"
-        desktop_content += "Type=Application\n"
-        desktop_content += f"Name={name}\n"
-        desktop_content += f"Exec={exec_command}\n" # Use the validated exec_command directly
+        lines = [
+            "[Desktop Entry]",
+            "Version=1.0",
+            "Type=Application",
+            f"Name={name}",
+            f"Exec={exec_command}", # Use the validated exec_command directly
+        ]
         if working_dir: # Only add Path if a valid working directory is determined
-            desktop_content += f"Path={working_dir}\n" 
+            lines.append(f"Path={working_dir}")
         
         # Optional fields
         if self.desc_var.get().strip():
-            desktop_content += f"Comment={self.desc_var.get().strip()}\n"
+            lines.append(f"Comment={self.desc_var.get().strip()}")
             
         if self.icon_var.get().strip():
-            desktop_content += f"Icon={self.icon_var.get().strip()}\n"
+            lines.append(f"Icon={self.icon_var.get().strip()}")
             
         if self.categories_var.get().strip():
-            desktop_content += f"Categories={self.categories_var.get().strip()};\n"
+            lines.append(f"Categories={self.categories_var.get().strip()};")
             
-        desktop_content += f"Terminal={str(self.terminal_var.get()).lower()}\n"
-        desktop_content += "StartupNotify=true\n"
+        lines.append(f"Terminal={str(self.terminal_var.get()).lower()}")
+        lines.append("StartupNotify=true")
+        lines.append("") # Trailing newline
+        desktop_content = "\n".join(lines)
         
         # Create the desktop file
         try:
@@ -521,7 +778,7 @@ class ShortcutCreator:
                 dest_dir.mkdir(parents=True, exist_ok=True)
                 
             # Clean filename: replace invalid chars for filename with underscore, then remove leading/trailing spaces/dots
-            safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_', '.') else '_' for c in name).strip().replace('__', '_')
+            safe_name = _UNDERSCORES_RE.sub('_', name.translate(_XLATE).strip())
             if not safe_name: # Fallback if name becomes empty after cleaning
                 safe_name = "untitled_shortcut"
             